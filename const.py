@@ -1,11 +0,0 @@
-"""Constants for the Amber Energy integration."""
-
-DOMAIN = "amber_energy"
-CONF_POSTCODE = "postcode"
-CONF_PAST_HOURS = "past_hours"
-
-DEFAULT_PAST_HOURS = 1
-
-# API
-API_BASE_URL = "https://backend.amber.com.au"
-API_ORIGIN = "https://www.amber.com.au"
@@ -2,20 +2,113 @@
 from __future__ import annotations
 
 import logging
-from datetime import timedelta
+from bisect import bisect_right
+from datetime import datetime, timedelta
+from typing import Any
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, PRICE_DATA_KEYS
 from .api import AmberEnergyAPI
 
 _LOGGER = logging.getLogger(__name__)
 
 PLATFORMS: list[Platform] = [Platform.SENSOR]
 SCAN_INTERVAL = timedelta(minutes=5)
+# Adaptive polling: wait for the next interval rollover, but never sleep
+# longer than MAX_SCAN_INTERVAL nor poll faster than MIN_SCAN_INTERVAL.
+MIN_SCAN_INTERVAL = timedelta(seconds=30)
+MAX_SCAN_INTERVAL = timedelta(minutes=15)
+BOUNDARY_DELAY = timedelta(seconds=5)
+
+
+def _intervals_with_dt(data: dict[str, Any], key: str) -> list[tuple]:
+    """Return list of (epoch seconds, interval) sorted by nemTime."""
+    items: list[tuple] = []
+    price_data = data.get(key)
+    if not price_data:
+        return items
+
+    for it in price_data[0].get("intervals") or []:
+        nem = it.get("nemTime")
+        if not nem or not isinstance(nem, str):
+            continue
+        try:
+            dt = datetime.fromisoformat(nem)
+        except ValueError:
+            _LOGGER.debug("Failed to parse nemTime '%s'", nem)
+            continue
+        if dt.tzinfo is None:
+            # Naive timestamps are local time, as dt_util.as_local() assumed
+            dt = dt.replace(tzinfo=dt_util.DEFAULT_TIME_ZONE)
+        # Only ordering matters, so compare as UTC epoch seconds
+        ts = dt.timestamp()
+        items.append((ts, it))
+
+    items.sort(key=lambda x: x[0])
+    return items
+
+
+def _split_at_now(
+    items: list[tuple], idx: int
+) -> tuple[dict[str, Any] | None, dict[str, Any] | None]:
+    """
+    Return the (current, next) intervals given idx = bisect_right(dts, now).
+
+    - Current is the most recent interval with nemTime <= now or, if none,
+      the earliest future interval (the API might only return forecasts).
+    - Next is the earliest interval with nemTime > now, or None.
+    """
+    if not items:
+        return None, None
+
+    current = items[idx - 1][1] if idx else items[0][1]
+    next_ = items[idx][1] if idx < len(items) else None
+    return current, next_
+
+
+def _rounded(value: Any) -> float | None:
+    """Round a numeric payload value to 2 places, or None if not a number."""
+    if isinstance(value, (int, float)):
+        return round(value, 2)
+    return None
+
+
+def _process_data(data: dict[str, Any]) -> dict[str, Any]:
+    """Parse the intervals and select current/next once for every sensor."""
+    now = dt_util.utcnow().timestamp()
+    boundaries: list[float] = []
+    for price_type, key in PRICE_DATA_KEYS.items():
+        items = _intervals_with_dt(data, key)
+        dts = [x[0] for x in items]
+        idx = bisect_right(dts, now)
+        current, next_ = _split_at_now(items, idx)
+        data[f"_{price_type}_current"] = current
+        data[f"_{price_type}_next"] = next_
+        # Round once per refresh, and only for the intervals sensors show
+        for interval in (current, next_):
+            if interval is not None:
+                interval["_perKwhRounded"] = _rounded(interval.get("perKwh", 0))
+                interval["_renewablesRounded"] = _rounded(
+                    interval.get("renewables", 0)
+                )
+        if idx < len(dts):
+            boundaries.append(dts[idx])
+    # Epoch seconds at which the current interval rolls over, if known
+    data["_next_boundary"] = min(boundaries, default=None)
+    return data
+
+
+def _next_update_interval(next_boundary: float | None) -> timedelta:
+    """Return the delay until the next poll, aligned to the interval rollover."""
+    if next_boundary is None:
+        return SCAN_INTERVAL
+    delay = timedelta(seconds=next_boundary - dt_util.utcnow().timestamp())
+    return min(MAX_SCAN_INTERVAL, max(MIN_SCAN_INTERVAL, delay + BOUNDARY_DELAY))
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
@@ -23,14 +116,21 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     postcode = entry.data["postcode"]
     past_hours = entry.data.get("past_hours")
 
-    api = AmberEnergyAPI(postcode, past_hours)
+    # Every entry's client uses Home Assistant's shared, pooled aiohttp session
+    api = AmberEnergyAPI(hass, postcode, past_hours)
 
     async def async_update_data():
         """Fetch data from API."""
         try:
-            return await hass.async_add_executor_job(api.get_prices)
+            data = _process_data(await api.async_get_prices())
+            coordinator.update_interval = _next_update_interval(
+                data["_next_boundary"]
+            )
         except Exception as err:
+            # Fall back to the regular cadence while the API is failing
+            coordinator.update_interval = SCAN_INTERVAL
             raise UpdateFailed(f"Error communicating with API: {err}") from err
+        return data
 
     coordinator = DataUpdateCoordinator(
         hass,
@@ -1,32 +1,62 @@
 """API client for Amber Energy."""
 import logging
+from http import HTTPStatus
 from typing import Any
 
-import requests
+import aiohttp
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import API_BASE_URL, API_ORIGIN, DEFAULT_PAST_HOURS
 
 _LOGGER = logging.getLogger(__name__)
 
+# Connections come from HA's pooled session, so connecting should be quick;
+# fail fast there and leave the remaining budget for reading the body.
+REQUEST_TIMEOUT = aiohttp.ClientTimeout(
+    total=10, connect=2, sock_connect=2, sock_read=8
+)
+
 
 class AmberEnergyAPI:
     """API client for Amber Energy pricing data."""
 
-    def __init__(self, postcode: str, past_hours: int | None = None) -> None:
+    def __init__(
+        self, hass: HomeAssistant, postcode: str, past_hours: int | None = None
+    ) -> None:
         """Initialize the API client."""
         self.postcode = postcode
         self.past_hours = past_hours or DEFAULT_PAST_HOURS
-
-    def get_prices(self) -> dict[str, Any]:
+        self._session = async_get_clientsession(hass)
+        self._url = f"{API_BASE_URL}/postcode/{postcode}/prices"
+        self._params = {"past-hours": self.past_hours}
+        self._headers = {"origin": API_ORIGIN, "accept": "application/json"}
+        # Body of the last 200 response and the headers to revalidate it
+        self._data: dict[str, Any] | None = None
+        self._conditional_headers = self._headers
+
+    async def async_get_prices(self) -> dict[str, Any]:
         """Fetch price data from Amber API."""
-        url = f"{API_BASE_URL}/postcode/{self.postcode}/prices"
-        params = {"past-hours": self.past_hours}
-        headers = {"origin": API_ORIGIN}
-
         try:
-            response = requests.get(url, params=params, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as err:
+            async with self._session.get(
+                self._url,
+                params=self._params,
+                headers=self._conditional_headers,
+                timeout=REQUEST_TIMEOUT,
+            ) as response:
+                if response.status == HTTPStatus.NOT_MODIFIED:
+                    if self._data is not None:
+                        return self._data
+                response.raise_for_status()
+                self._data = json_loads(await response.read())
+                self._conditional_headers = dict(self._headers)
+                if etag := response.headers.get("ETag"):
+                    self._conditional_headers["if-none-match"] = etag
+                if last_modified := response.headers.get("Last-Modified"):
+                    self._conditional_headers["if-modified-since"] = last_modified
+                return self._data
+        except (aiohttp.ClientError, TimeoutError) as err:
             _LOGGER.error("Error fetching Amber Energy data: %s", err)
             raise
@@ -29,11 +29,11 @@ STEP_USER_DATA_SCHEMA = vol.Schema(
 async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str, Any]:
     """Validate the user input allows us to connect."""
     api = AmberEnergyAPI(
-        data[CONF_POSTCODE], data.get(CONF_PAST_HOURS, DEFAULT_PAST_HOURS)
+        hass, data[CONF_POSTCODE], data.get(CONF_PAST_HOURS, DEFAULT_PAST_HOURS)
     )
 
     try:
-        result = await hass.async_add_executor_job(api.get_prices)
+        result = await api.async_get_prices()
     except Exception as err:
         _LOGGER.error("Error connecting to Amber API: %s", err)
         raise CannotConnect from err
@@ -6,6 +6,9 @@ CONF_PAST_HOURS = "past_hours"
 
 DEFAULT_PAST_HOURS = 1
 
+# Price type -> key holding its data in the API response
+PRICE_DATA_KEYS = {"general": "priceData", "feedin": "feedInPriceData"}
+
 # API
 API_BASE_URL = "https://backend.amber.com.au"
 API_ORIGIN = "https://www.amber.com.au"
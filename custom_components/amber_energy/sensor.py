@@ -2,27 +2,99 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, List, Tuple
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any, List
 
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
+    SensorEntityDescription,
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CURRENCY_CENT
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.helpers.typing import StateType
 from homeassistant.helpers.update_coordinator import (
     CoordinatorEntity,
     DataUpdateCoordinator,
 )
-from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN
+from .const import DOMAIN, PRICE_DATA_KEYS
 
 _LOGGER = logging.getLogger(__name__)
 
+_LABELS = {"general": "General Usage", "feedin": "Feed-In"}
+_UNIT_PRICE = f"{CURRENCY_CENT}/kWh"
+
+
+@dataclass(frozen=True, kw_only=True)
+class AmberSensorEntityDescription(SensorEntityDescription):
+    """Describes an Amber Energy sensor."""
+
+    name_suffix: str
+    value_fn: Callable[[dict[str, Any]], StateType]
+    attrs_fn: Callable[[dict[str, Any]], dict[str, Any]]
+    use_next: bool = False
+
+
+AMBER_SENSORS: tuple[AmberSensorEntityDescription, ...] = (
+    AmberSensorEntityDescription(
+        key="current_price",
+        name_suffix="Current Price",
+        native_unit_of_measurement=_UNIT_PRICE,
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:currency-usd",
+        value_fn=lambda iv: iv["_perKwhRounded"],
+        attrs_fn=lambda iv: {
+            "nem_time": iv.get("nemTime"),
+            "descriptor": iv.get("descriptor"),
+            "renewables": iv.get("renewables"),
+        },
+    ),
+    AmberSensorEntityDescription(
+        key="next_price",
+        name_suffix="Next Price",
+        native_unit_of_measurement=_UNIT_PRICE,
+        device_class=SensorDeviceClass.MONETARY,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:currency-usd-clock",
+        value_fn=lambda iv: iv["_perKwhRounded"],
+        attrs_fn=lambda iv: {
+            "nem_time": iv.get("nemTime"),
+            "descriptor": iv.get("descriptor"),
+            "renewables": iv.get("renewables"),
+        },
+        use_next=True,
+    ),
+    AmberSensorEntityDescription(
+        key="renewables",
+        name_suffix="Renewables",
+        native_unit_of_measurement="%",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:leaf",
+        value_fn=lambda iv: iv["_renewablesRounded"],
+        attrs_fn=lambda iv: {
+            "nem_time": iv.get("nemTime"),
+            "descriptor": iv.get("descriptor"),
+        },
+    ),
+    AmberSensorEntityDescription(
+        key="descriptor",
+        name_suffix="Descriptor",
+        icon="mdi:information",
+        value_fn=lambda iv: iv.get("descriptor"),
+        attrs_fn=lambda iv: {
+            "nem_time": iv.get("nemTime"),
+            "price_per_kwh": iv["_perKwhRounded"],
+            "renewables": iv.get("renewables"),
+        },
+    ),
+)
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -32,26 +104,29 @@ async def async_setup_entry(
     """Set up Amber Energy sensors."""
     coordinator: DataUpdateCoordinator = hass.data[DOMAIN][entry.entry_id]
 
-    entities: list[SensorEntity] = []
-
-    # General usage sensors
-    entities.append(AmberCurrentPriceSensor(coordinator, entry, "general"))
-    entities.append(AmberNextPriceSensor(coordinator, entry, "general"))
-    entities.append(AmberRenewablesSensor(coordinator, entry, "general"))
-    entities.append(AmberDescriptorSensor(coordinator, entry, "general"))
-
-    # Feed-in sensors
-    entities.append(AmberCurrentPriceSensor(coordinator, entry, "feedin"))
-    entities.append(AmberNextPriceSensor(coordinator, entry, "feedin"))
-    entities.append(AmberRenewablesSensor(coordinator, entry, "feedin"))
-    entities.append(AmberDescriptorSensor(coordinator, entry, "feedin"))
-
-    async_add_entities(entities)
+    async_add_entities(
+        AmberSensor(coordinator, entry, price_type, description)
+        for price_type in ("general", "feedin")
+        for description in AMBER_SENSORS
+    )
 
 
 class AmberBaseSensor(CoordinatorEntity, SensorEntity):
     """Base class for Amber Energy sensors."""
 
+    # _attr_* stay in the instance dict inherited from Entity; slotting them
+    # would shadow the class-level defaults HA relies on.
+    __slots__ = (
+        "_entry",
+        "_price_type",
+        "_price_key",
+        "_postcode",
+        "_last_key",
+        "_available",
+        "_value",
+        "_attrs",
+    )
+
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
@@ -62,249 +137,114 @@ class AmberBaseSensor(CoordinatorEntity, SensorEntity):
         super().__init__(coordinator)
         self._entry = entry
         self._price_type = price_type
+        self._price_key = PRICE_DATA_KEYS[price_type]
         self._postcode: str = entry.data["postcode"]
+        self._last_key: tuple | None = None
+        self._available = False
+        self._value: StateType = None
+        self._attrs: dict[str, Any] = {}
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        return self._available
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value computed at the last coordinator update."""
+        return self._value
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the attributes computed at the last coordinator update."""
+        return self._attrs
+
+    def _compute_available(self) -> bool:
+        """Return availability for the latest coordinator data."""
         return self.coordinator.last_update_success and bool(self._get_intervals())
 
+    def _compute_state(self) -> tuple[StateType, dict[str, Any]]:
+        """Return the (value, attributes) for the latest coordinator data."""
+        return None, {}
+
+    def _update_state(self) -> bool:
+        """Recompute the cached state; return True if it changed."""
+        available = self._compute_available()
+        value, attrs = self._compute_state()
+        key = (available, value, attrs)
+        if key == self._last_key:
+            return False
+        self._last_key = key
+        self._available, self._value, self._attrs = key
+        return True
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when the published state actually changed."""
+        # The coordinator calls every entity's listener synchronously in one
+        # loop, so all state writes for a refresh already land in one tick.
+        if self._update_state():
+            super()._handle_coordinator_update()
+
     def _get_intervals(self) -> List[dict[str, Any]] | None:
         """Get the intervals for the price type from the coordinator data."""
-        if not self.coordinator.data:
+        data = self.coordinator.data
+        if not data:
             return None
 
-        if self._price_type == "general":
-            price_data = self.coordinator.data.get("priceData", [])
-        else:
-            price_data = self.coordinator.data.get("feedInPriceData", [])
-
-        if price_data and len(price_data) > 0:
+        price_data = data.get(self._price_key)
+        if price_data:
             return price_data[0].get("intervals", [])
 
         return None
 
-    def _intervals_with_dt(self) -> List[Tuple]:
-        """Return list of (datetime, interval) sorted by datetime (local)."""
-        intervals = self._get_intervals()
-        items: List[Tuple] = []
-        if not intervals:
-            return items
-
-        for it in intervals:
-            nem = it.get("nemTime")
-            if not nem:
-                continue
-            try:
-                dt = dt_util.parse_datetime(nem)
-                if dt is None:
-                    continue
-                # Convert to local timezone used by Home Assistant
-                dt = dt_util.as_local(dt)
-                items.append((dt, it))
-            except Exception as err:  # pragma: no cover - defensive
-                _LOGGER.debug("Failed to parse nemTime '%s': %s", nem, err)
-                continue
-
-        items.sort(key=lambda x: x[0])
-        return items
-
     def _get_current_interval(self) -> dict[str, Any] | None:
-        """
-        Determine the current interval:
-        - Prefer the most recent interval with nemTime <= now.
-        - If none, pick the earliest future interval (useful if API only returns future forecasts).
-        - Fallback to the last interval if parsing fails.
-        """
-        items = self._intervals_with_dt()
-        if not items:
+        """Return the current interval selected by the coordinator."""
+        if not self.coordinator.data:
             return None
-
-        now = dt_util.now()
-        past_items = [it for it in items if it[0] <= now]
-        future_items = [it for it in items if it[0] > now]
-
-        if past_items:
-            # Most recent past (or exactly now)
-            return past_items[-1][1]
-        if future_items:
-            # No past, pick earliest future as "current" (API might only return forecasts)
-            return future_items[0][1]
-
-        # Fallback
-        return items[-1][1]
+        return self.coordinator.data.get(f"_{self._price_type}_current")
 
     def _get_next_interval(self) -> dict[str, Any] | None:
-        """
-        Determine the next interval:
-        - The earliest interval with nemTime > now.
-        - If none, return None (no future available).
-        """
-        items = self._intervals_with_dt()
-        if not items:
+        """Return the next interval selected by the coordinator."""
+        if not self.coordinator.data:
             return None
+        return self.coordinator.data.get(f"_{self._price_type}_next")
 
-        now = dt_util.now()
-        future_items = [it for it in items if it[0] > now]
-        if future_items:
-            return future_items[0][1]
-
-        # No future interval
-        return None
-
-
-class AmberCurrentPriceSensor(AmberBaseSensor):
-    """Sensor for current Amber Energy price."""
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        entry: ConfigEntry,
-        price_type: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, price_type)
-        type_label = "Feed-In" if price_type == "feedin" else "General Usage"
-        self._attr_name = f"Amber {type_label} Current Price"
-        self._attr_unique_id = f"{entry.entry_id}_{price_type}_current_price"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_CENT}/kWh"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_icon = "mdi:currency-usd"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the current price (raw from API)."""
-        interval = self._get_current_interval()
-        if interval:
-            return round(interval.get("perKwh", 0), 2)
-        return None
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes including descriptor and renewables."""
-        interval = self._get_current_interval()
-        if interval:
-            return {
-                "nem_time": interval.get("nemTime"),
-                "descriptor": interval.get("descriptor"),
-                "renewables": interval.get("renewables"),
-                "postcode": self._postcode,
-            }
-        return {}
+class AmberSensor(AmberBaseSensor):
+    """Amber Energy sensor driven by an entity description."""
 
+    entity_description: AmberSensorEntityDescription
 
-class AmberNextPriceSensor(AmberBaseSensor):
-    """Sensor for next Amber Energy price."""
+    __slots__ = ()
 
     def __init__(
         self,
         coordinator: DataUpdateCoordinator,
         entry: ConfigEntry,
         price_type: str,
+        description: AmberSensorEntityDescription,
     ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator, entry, price_type)
-        type_label = "Feed-In" if price_type == "feedin" else "General Usage"
-        self._attr_name = f"Amber {type_label} Next Price"
-        self._attr_unique_id = f"{entry.entry_id}_{price_type}_next_price"
-        self._attr_native_unit_of_measurement = f"{CURRENCY_CENT}/kWh"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_icon = "mdi:currency-usd-clock"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the next price (raw from API)."""
-        interval = self._get_next_interval()
-        if interval:
-            return round(interval.get("perKwh", 0), 2)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        """Return additional attributes including descriptor and renewables for next."""
-        interval = self._get_next_interval()
-        if interval:
-            return {
-                "nem_time": interval.get("nemTime"),
-                "descriptor": interval.get("descriptor"),
-                "renewables": interval.get("renewables"),
-                "postcode": self._postcode,
-            }
-        return {}
-
-
-class AmberRenewablesSensor(AmberBaseSensor):
-    """Sensor for current renewables percentage."""
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        entry: ConfigEntry,
-        price_type: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, price_type)
-        type_label = "Feed-In" if price_type == "feedin" else "General Usage"
-        self._attr_name = f"Amber {type_label} Renewables"
-        self._attr_unique_id = f"{entry.entry_id}_{price_type}_renewables"
-        self._attr_native_unit_of_measurement = "%"
-        self._attr_state_class = SensorStateClass.MEASUREMENT
-        self._attr_icon = "mdi:leaf"
-
-    @property
-    def native_value(self) -> float | None:
-        """Return the renewables percentage for current interval."""
-        interval = self._get_current_interval()
-        if interval:
-            return round(interval.get("renewables", 0), 2)
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        interval = self._get_current_interval()
-        if interval:
-            return {
-                "nem_time": interval.get("nemTime"),
-                "descriptor": interval.get("descriptor"),
-                "postcode": self._postcode,
-            }
-        return {}
-
-
-class AmberDescriptorSensor(AmberBaseSensor):
-    """Sensor for current price descriptor."""
-
-    def __init__(
-        self,
-        coordinator: DataUpdateCoordinator,
-        entry: ConfigEntry,
-        price_type: str,
-    ) -> None:
-        """Initialize the sensor."""
-        super().__init__(coordinator, entry, price_type)
-        type_label = "Feed-In" if price_type == "feedin" else "General Usage"
-        self._attr_name = f"Amber {type_label} Descriptor"
-        self._attr_unique_id = f"{entry.entry_id}_{price_type}_descriptor"
-        self._attr_icon = "mdi:information"
-
-    @property
-    def native_value(self) -> str | None:
-        """Return the price descriptor (raw)."""
-        interval = self._get_current_interval()
-        if interval:
-            return interval.get("descriptor")
-        return None
-
-    @property
-    def extra_state_attributes(self) -> dict[str, Any]:
-        interval = self._get_current_interval()
-        if interval:
-            return {
-                "nem_time": interval.get("nemTime"),
-                "price_per_kwh": round(interval.get("perKwh", 0), 2),
-                "renewables": interval.get("renewables"),
-                "postcode": self._postcode,
-            }
-        return {}
+        self.entity_description = description
+        self._attr_name = f"Amber {_LABELS[price_type]} {description.name_suffix}"
+        self._attr_unique_id = f"{entry.entry_id}_{price_type}_{description.key}"
+        self._update_state()
+
+    def _interval(self) -> dict[str, Any] | None:
+        """Return the interval this sensor reports on."""
+        if self.entity_description.use_next:
+            return self._get_next_interval()
+        return self._get_current_interval()
+
+    def _compute_state(self) -> tuple[StateType, dict[str, Any]]:
+        """Return the value and attributes for the interval."""
+        interval = self._interval()
+        if not interval:
+            return None, {}
+        description = self.entity_description
+        return description.value_fn(interval), {
+            **description.attrs_fn(interval),
+            "postcode": self._postcode,
+        }